@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+import sys
+sys.path.append('..')
+
+from example_lexer import scan, T as Tag
+from parser_edsl import NTerm
+
+E = NTerm('E')
+T = NTerm('T')
+F = NTerm('F')
+
+E += T | E << Tag.PLUS << T << (lambda x, y: x + y)
+T += F | T << Tag.MUL << F << (lambda x, y: x * y)
+F += Tag.NUMBER | Tag.LP << E << Tag.RP
+
+parser = E.build_parser()
+print(parser.memory_report())
+parser.finalize()
+print(parser.memory_report())
+print(E.parse(list(scan("(3+2)*10"))))
@@ -228,15 +228,89 @@ class State:
                 self.items |= temp
                 should_continue = True
 
+def deep_sizeof(obj, seen=None):
+    if seen is None:
+        seen = set()
+    size = 0
+    stack = [obj]
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen or isinstance(obj, (int, str, Symbol, NTerm, StartNTerm, Rule, Enum)):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif isinstance(obj, (Action, Item, State, OrderedSet)):
+            stack.append(vars(obj))
+    return size
+
 class LALRParser:
-    def __init__(self, grammar):
+    def __init__(self, grammar, finalize=False):
         self.grammar = grammar
         self.goto_table = {}
         self.action_table = {}
         self.canonical_collection = []
+        self.finalized = False
+        self.nonterminal_states = None
         self.build_states()
         self.build_goto_table()
         self.build_action_table()
+        if finalize:
+            self.finalize()
+    def state_count(self):
+        return len(self.action_table)
+    def table_density(self):
+        states = self.state_count()
+        action_cells = states * len(self.grammar.terminals | {DomainTag.END_OF_TEXT})
+        goto_cells = states * len(self.grammar.nonterminals)
+        action_entries = sum(len(row) for row in self.action_table.values())
+        goto_entries = sum(len(row) for row in self.goto_table.values())
+        return {
+            'action': action_entries / action_cells if action_cells else 0.0,
+            'goto': goto_entries / goto_cells if goto_cells else 0.0,
+        }
+    def compute_nonterminal_states(self):
+        if self.nonterminal_states is None:
+            self.nonterminal_states = {}
+            for state in self.canonical_collection:
+                owners = set()
+                for item in state.items:
+                    if item.marker > 0 and not isinstance(item.rule.left_side, StartNTerm):
+                        owners.add(item.rule.left_side)
+                for nonterminal in owners:
+                    self.nonterminal_states[nonterminal] = self.nonterminal_states.get(nonterminal, 0) + 1
+        return self.nonterminal_states
+    def memory_report(self):
+        seen = set()
+        tables = deep_sizeof(self.action_table, seen) + deep_sizeof(self.goto_table, seen)
+        artifacts = 0
+        if not self.finalized:
+            artifacts += deep_sizeof(self.canonical_collection, seen)
+            artifacts += deep_sizeof(self.grammar.first_sets, seen)
+            artifacts += deep_sizeof(self.grammar.follow_sets, seen)
+        density = self.table_density()
+        return {
+            'states': self.state_count(),
+            'action_density': density['action'],
+            'goto_density': density['goto'],
+            'table_bytes': tables,
+            'construction_bytes': artifacts,
+            'nonterminal_states': dict(('%s#%d' % (n.name, n.id), c) for n, c in self.compute_nonterminal_states().items()),
+            'finalized': self.finalized,
+        }
+    def finalize(self):
+        if self.finalized:
+            return
+        self.compute_nonterminal_states()
+        # A finalized grammar keeps only its rules: it cannot be reused to build another parser.
+        self.canonical_collection = []
+        self.grammar.first_sets = None
+        self.grammar.follow_sets = None
+        self.finalized = True
     def build_goto_table(self):
         self.goto_table = {}
         for i in range(len(self.canonical_collection)):
@@ -385,7 +459,7 @@ class NTerm(Symbol):
         return False
     def __str__(self):
         return self.name
-    def parse(self, tokens):
+    def build_parser(self, finalize=False):
         if self.parser == None:
             terminals = set()
             start_nonterminal = self
@@ -407,5 +481,9 @@ class NTerm(Symbol):
                         if not isinstance(item, NTerm):
                             terminals.add(item)
             grammar = Grammar(rules, terminals, nonterminals, start_nonterminal)
-            self.parser = LALRParser(grammar)
-        return self.parser.parse(tokens)
+            self.parser = LALRParser(grammar, finalize)
+        elif finalize:
+            self.parser.finalize()
+        return self.parser
+    def parse(self, tokens):
+        return self.build_parser().parse(tokens)